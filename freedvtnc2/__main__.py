@@ -43,6 +43,8 @@ def main():
     # Command interface (freedvtnc2-lfm addition)
     p.add('--cmd-port', type=int, default=8002, env_var="FREEDVTNC2_CMD_PORT", help="TCP port for command interface (0 to disable)")
     p.add('--cmd-address', type=str, default="0.0.0.0", env_var="FREEDVTNC2_CMD_ADDRESS", help="Address to bind command interface")
+    p.add('--cmd-workers', type=int, default=1, env_var="FREEDVTNC2_CMD_WORKERS", help="Number of command interface listener threads. Values above 1 use SO_REUSEPORT")
+    p.add('--cmd-max-clients', type=int, default=16, env_var="FREEDVTNC2_CMD_MAX_CLIENTS", help="Maximum number of simultaneous command interface connections")
 
     options = p.parse_args()
 
@@ -57,7 +59,7 @@ def main():
             super().__init__()
             self.log_buffer = ""
         def emit(self, record):
-            for message in record.msg.split("\n"):
+            for message in record.getMessage().split("\n"):
                 if record.name == "root" and record.module == "__main__":
                     msg = HTML(f"<log.{record.levelname.lower()}.msg>{{}}</log.{record.levelname.lower()}.msg>\n").format(message).value
                 else:
@@ -4,6 +4,7 @@ from tabulate import tabulate
 import logging
 import audioop as pyaudioop
 import time
+from collections import deque
 from threading import Lock, Thread
 from typing import Callable
 #from pydub import pyaudioop
@@ -193,7 +194,7 @@ class OutputDevice():
         self.ptt_on_delay_ms = ptt_on_delay_ms
         self.ptt_off_delay_ms = ptt_off_delay_ms
         self.db = db
-        self.send_queue = []
+        self.send_queue: deque[Packet] = deque()
         self.modem = modem
 
         if type(name_or_id) == str:
@@ -273,8 +274,8 @@ class OutputDevice():
         write_buffer = pre_silence.raw_data
         
         with self.send_queue_lock:
-            send_queue = self.send_queue
-            self.send_queue = []
+            send_queue = list(self.send_queue)
+            self.send_queue.clear()
         data = self.modem.write(send_queue)
 
         if self.device.sample_rate != self.sample_rate:
@@ -368,7 +369,7 @@ class OutputDevice():
         # Clear any pending TX
         self.clear()
         with self.send_queue_lock:
-            self.send_queue = []
+            self.send_queue.clear()
         logging.info("TX gate: DISABLED")
 
     def tx_window(self, seconds: int):
@@ -5,14 +5,110 @@ Provides runtime control of the modem via ASCII commands on port 8002.
 See PROTOCOL.md for full specification.
 """
 
+import os
 import socket
+import selectors
 import threading
+import time
 import logging
+import functools
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Optional, Callable
 import argparse
+import configargparse
+import pydub.generators
 
 logger = logging.getLogger(__name__)
 
+MAX_LINE_LENGTH = 1024  # Longest accepted command line, excluding the newline
+# A partial line never exceeds MAX_LINE_LENGTH, so every recv has at least 4 KiB of room
+RX_BUFFER_SIZE = MAX_LINE_LENGTH + 4096
+MAX_PENDING_OUTPUT = 64 * 1024  # Stop reading from a client whose unsent replies pass this
+CLIENT_IDLE_TIMEOUT = 300.0  # Seconds without any received data before a client is dropped
+
+# ASCII a-z -> A-Z, every other byte unchanged. bytes.translate applies it in one C pass
+_UPPER_LUT = bytes((c - 32) if 0x61 <= c <= 0x7A else c for c in range(256))
+
+# Static replies, encoded and newline-terminated once at import
+_OK_PONG = b"OK PONG\n"
+_OK_FOLLOW_ON = b"OK FOLLOW ON\n"
+_OK_FOLLOW_OFF = b"OK FOLLOW OFF\n"
+_OK_PTT_TEST = b"OK PTT TEST started\n"
+_OK_CLEAR = b"OK CLEAR\n"
+_OK_TX_ENABLED = b"OK TX ENABLED\n"
+_OK_TX_DISABLED = b"OK TX DISABLED\n"
+_ERR_TOO_MANY = b"ERROR Too many connections\n"
+_ERR_LINE_TOO_LONG = b"ERROR Line too long\n"
+_ERR_VOLUME = b"ERROR Invalid volume (must be number in dB)\n"
+_ERR_FOLLOW = b"ERROR Invalid follow state. Use: ON or OFF\n"
+_ERR_PTT = b"ERROR Unknown PTT command. Use: PTT TEST\n"
+_ERR_TX = b"ERROR Unknown TX command. Use: TX ENABLE|DISABLE|WINDOW <sec>|STATUS\n"
+_ERR_TX_WINDOW_ARG = b"ERROR TX WINDOW requires seconds argument\n"
+_ERR_TX_WINDOW_RANGE = b"ERROR TX WINDOW seconds must be 1-600\n"
+_ERR_TX_WINDOW_INT = b"ERROR TX WINDOW seconds must be integer\n"
+
+# Templates for dynamic replies, bound once so each reply is a single str.format call
+_STATUS_FMT = "OK STATUS MODE={} VOLUME={} FOLLOW={} PTT={} CHANNEL={}".format
+_MODE_FMT = "OK MODE {}".format
+_VOLUME_FMT = "OK VOLUME {}".format
+
+
+_SAVE_PARSER = configargparse.DefaultConfigFileParser()
+
+
+@functools.lru_cache(maxsize=None)
+def _config_key(option: str) -> str:
+    """Config file key for an options attribute, e.g. output_volume -> output-volume."""
+    return option.replace("_", "-")
+
+
+@functools.lru_cache(maxsize=128)
+def _encode_reply(response: str) -> bytes:
+    """Encode a dynamic reply for the wire. Repeated replies (e.g. MODE/VOLUME queries) hit the cache."""
+    return f"{response}\n".encode('utf-8')
+
+
+class _RxBufPool:
+    """
+    Process-wide pool of receive buffers shared by all listener threads.
+
+    Buffers are checked out when a client connects and returned when it
+    disconnects. An empty pool hands out a fresh buffer; at most maxsize
+    buffers are kept for reuse.
+    """
+
+    def __init__(self, maxsize: int, bufsize: int):
+        self.maxsize = maxsize
+        self.bufsize = bufsize
+        self._free: deque[bytearray] = deque()
+        self._lock = threading.Lock()
+
+    def get(self) -> bytearray:
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+        return bytearray(self.bufsize)
+
+    def put(self, buf: bytearray):
+        with self._lock:
+            if len(self._free) < self.maxsize:
+                self._free.append(buf)
+
+
+_RXPOOL = _RxBufPool(maxsize=32, bufsize=RX_BUFFER_SIZE)
+
+
+@dataclass
+class _Connection:
+    """Per-client state for the command server event loop."""
+    addr: tuple
+    rxbuf: bytearray  # Fixed size, checked out from _RXPOOL and reused for every recv_into
+    used: int = 0  # Bytes of rxbuf holding received data not yet terminated by newline
+    out: bytearray = field(default_factory=bytearray)  # Response bytes the socket has not accepted yet
+    last_active: float = field(default_factory=time.monotonic)
+
 
 class CommandServer:
     """
@@ -50,205 +146,404 @@ class CommandServer:
         self.port = port
         self.address = address
         self.running = False
-        self.server_socket: Optional[socket.socket] = None
-        self._thread: Optional[threading.Thread] = None
+        self.server_sockets: list[socket.socket] = []
+        self._threads: list[threading.Thread] = []
+        self._wakers: list[socket.socket] = []  # Write ends of each event loop's wakeup socketpair
+
+        self._save_path = str(Path.home() / ".freedvtnc2.conf")
+        self._ptt_cache: dict[int, bytes] = {}  # PTT TEST tone raw audio by sample rate
+
+        # Open client connections across all listeners, capped at max_clients
+        self.max_clients = max(1, getattr(options, 'cmd_max_clients', 16) or 1)
+        self._clients = 0
+        self._clients_lock = threading.Lock()
 
         # Valid modes (imported from modem module)
         from .modem import Modems
-        self.valid_modes = [m.name for m in Modems]
+        mode_names = tuple(m.name for m in Modems)
+        self.valid_modes = frozenset(mode_names)
+        self._valid_modes_msg = f"ERROR Invalid mode. Valid: {', '.join(mode_names)}\n".encode('utf-8')
+
+        # Command name -> handler, every handler takes the uppercased argument as bytes
+        # and returns either a str or an already encoded, newline-terminated reply
+        self._dispatch: dict[bytes, Callable[[bytes], str | bytes]] = {
+            b"PING": self._cmd_ping,
+            b"MODE": self._cmd_mode,
+            b"VOLUME": self._cmd_volume,
+            b"FOLLOW": self._cmd_follow,
+            b"STATUS": self._cmd_status,
+            b"LEVELS": self._cmd_levels,
+            b"PTT": self._cmd_ptt,
+            b"TX": self._cmd_tx,
+            b"CLEAR": self._cmd_clear,
+            b"SAVE": self._cmd_save,
+        }
 
     def start(self):
-        """Start the command server in a background thread."""
+        """Start the command server event loop in a background thread."""
         if self.running:
             logger.warning("CommandServer already running")
             return
 
+        workers = max(1, getattr(self.options, 'cmd_workers', 1) or 1)
+        if workers > 1 and not hasattr(socket, "SO_REUSEPORT"):
+            logger.warning("CommandServer: SO_REUSEPORT not supported on this platform, using a single listener")
+            workers = 1
+
         self.running = True
-        self._thread = threading.Thread(target=self._server_loop, daemon=True)
-        self._thread.start()
-        logger.info(f"CommandServer started on {self.address}:{self.port}")
+        self._threads = [
+            threading.Thread(target=self._server_loop, args=(worker, workers > 1), daemon=True)
+            for worker in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"CommandServer started on {self.address}:{self.port} ({workers} listener{'s' if workers > 1 else ''})")
 
     def stop(self):
         """Stop the command server."""
         self.running = False
-        if self.server_socket:
+        for waker in list(self._wakers):
+            try:
+                waker.send(b"x")
+            except OSError:
+                pass
+        for sock in self.server_sockets:
             try:
-                self.server_socket.close()
+                sock.close()
             except:
                 pass
         logger.info("CommandServer stopped")
 
-    def _server_loop(self):
-        """Main server loop - accepts connections."""
-        try:
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.server_socket.bind((self.address, self.port))
-            self.server_socket.listen(5)
-            self.server_socket.settimeout(1.0)  # Allow periodic check of self.running
+    def _server_loop(self, worker: int = 0, reuse_port: bool = False):
+        """
+        Bind a listening socket and run an event loop on it.
 
-            while self.running:
-                try:
-                    conn, addr = self.server_socket.accept()
-                    logger.debug(f"CommandServer connection from {addr}")
-                    handler = threading.Thread(
-                        target=self._handle_connection,
-                        args=(conn, addr),
-                        daemon=True
-                    )
-                    handler.start()
-                except socket.timeout:
-                    continue
-                except Exception as e:
-                    if self.running:
-                        logger.error(f"CommandServer accept error: {e}")
+        With several workers each thread owns its own SO_REUSEPORT socket,
+        so the kernel spreads incoming connections across the accept queues.
+        """
+        sock = None
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if reuse_port:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                self._pin_worker(worker)
+            sock.bind((self.address, self.port))
+            sock.listen(5)
+            sock.setblocking(False)
+            self.server_sockets.append(sock)
+            self._listener(sock)
         except Exception as e:
-            logger.error(f"CommandServer error: {e}")
+            if self.running:
+                logger.error(f"CommandServer error: {e}")
         finally:
-            if self.server_socket:
+            if sock:
                 try:
-                    self.server_socket.close()
+                    sock.close()
                 except:
                     pass
 
-    def _handle_connection(self, conn: socket.socket, addr):
-        """Handle a single client connection."""
-        conn.settimeout(None)  # No timeout for client connections
-        buffer = ""
-
+    @staticmethod
+    def _pin_worker(worker: int):
+        """Pin the calling listener thread to one CPU (Linux only)."""
+        if not hasattr(os, "sched_setaffinity"):
+            return
+        try:
+            cpus = sorted(os.sched_getaffinity(0))
+            os.sched_setaffinity(0, {cpus[worker % len(cpus)]})
+        except OSError as e:
+            logger.debug("CommandServer could not pin listener %d: %s", worker, e)
+
+    def _listener(self, server_socket: socket.socket):
+        """Event loop - accepts connections and services clients."""
+        sel = selectors.DefaultSelector()
+        # stop() writes to wake_w so the loop never has to poll self.running
+        wake_r, wake_w = socket.socketpair()
+        self._wakers.append(wake_w)
         try:
+            sel.register(server_socket, selectors.EVENT_READ, data=None)
+            sel.register(wake_r, selectors.EVENT_READ, data=None)
+
             while self.running:
-                data = conn.recv(1024)
-                if not data:
-                    break
-
-                buffer += data.decode('utf-8', errors='ignore')
-
-                # Process complete lines
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-                    line = line.strip()
-                    if line:
-                        response = self._process_command(line)
-                        conn.send(f"{response}\n".encode('utf-8'))
-        except Exception as e:
-            logger.debug(f"CommandServer connection error: {e}")
+                timeout = self._reap_idle(sel, time.monotonic())
+                for key, mask in sel.select(timeout=timeout):
+                    if key.fileobj is wake_r:
+                        continue
+                    if key.data is None:
+                        self._accept(sel, key.fileobj)
+                        continue
+                    try:
+                        if mask & selectors.EVENT_WRITE:
+                            self._flush(sel, key.fileobj, key.data)
+                        if mask & selectors.EVENT_READ:
+                            self._read(sel, key.fileobj, key.data)
+                    except Exception as e:
+                        logger.debug("CommandServer connection error: %s", e)
+                        self._close(sel, key.fileobj, key.data)
         finally:
+            for key in list(sel.get_map().values()):
+                if key.data is not None:
+                    self._close(sel, key.fileobj, key.data)
+            sel.close()
+            self._wakers.remove(wake_w)
+            wake_r.close()
+            wake_w.close()
+
+    def _accept(self, sel: selectors.BaseSelector, server_socket: socket.socket):
+        """Accept a pending client and register it with the selector."""
+        try:
+            conn, addr = server_socket.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        except Exception as e:
+            if self.running:
+                logger.error("CommandServer accept error: %s", e)
+            return
+
+        with self._clients_lock:
+            accepted = self._clients < self.max_clients
+            if accepted:
+                self._clients += 1
+        if not accepted:
+            logger.warning("CommandServer rejecting %s: %d clients already connected", addr, self.max_clients)
             try:
-                conn.close()
-            except:
+                conn.setblocking(False)
+                conn.send(_ERR_TOO_MANY)
+            except OSError:
                 pass
-            logger.debug(f"CommandServer connection closed from {addr}")
-
-    def _process_command(self, command: str) -> str:
-        """Process a single command and return response."""
-        parts = command.upper().split(None, 1)  # Split on whitespace, max 2 parts
-        if not parts:
-            return "ERROR Empty command"
-
-        cmd = parts[0]
-        arg = parts[1] if len(parts) > 1 else ""
+            conn.close()
+            return
 
+        logger.debug("CommandServer connection from %s", addr)
+        client = _Connection(addr, _RXPOOL.get())
         try:
-            if cmd == "PING":
-                return "OK PONG"
-
-            elif cmd == "MODE":
-                return self._cmd_mode(arg)
+            conn.setblocking(False)
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # Replies are tiny - don't let Nagle hold them
+            self._enable_keepalive(conn, addr)
+            sel.register(conn, selectors.EVENT_READ, data=client)
+        except (OSError, ValueError) as e:
+            # e.g. the peer reset before setup finished - drop this client, keep the loop running.
+            # Never registered, so _close will not run for it - give the slot back here
+            logger.warning("CommandServer could not set up connection from %s: %s", addr, e)
+            try:
+                conn.close()
+            except OSError:
+                pass
+            _RXPOOL.put(client.rxbuf)
+            self._release_slot()
 
-            elif cmd == "VOLUME":
-                return self._cmd_volume(arg)
+    @staticmethod
+    def _enable_keepalive(conn: socket.socket, addr):
+        """Let the kernel notice peers that vanished without closing. Best effort - the idle timeout still applies."""
+        try:
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 20)
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+        except OSError as e:
+            logger.debug("CommandServer could not enable keepalive for %s: %s", addr, e)
+
+    def _read(self, sel: selectors.BaseSelector, conn: socket.socket, client: "_Connection"):
+        """Read what is available from a client and answer any complete lines."""
+        rxbuf = client.rxbuf
+        used = client.used
+
+        with memoryview(rxbuf) as view:
+            try:
+                n = conn.recv_into(view[used:])
+            except (BlockingIOError, InterruptedError):
+                return
+            if not n:
+                self._close(sel, conn, client)
+                return
+            # The first `used` bytes are a partial line already scanned without finding a newline,
+            # so only the new bytes need searching - a long line arriving in pieces stays linear
+            scan_from = used
+            used += n
+            client.last_active = time.monotonic()
+
+            # Process complete lines
+            start = 0
+            nl = rxbuf.find(b'\n', scan_from, used)
+            while nl != -1 and nl - start <= MAX_LINE_LENGTH:
+                response = self._process_command(bytes(view[start:nl]))
+                start = nl + 1
+                if response is not None:
+                    if not isinstance(response, bytes):
+                        response = _encode_reply(response)
+                    client.out += response
+                nl = rxbuf.find(b'\n', start, used)
+
+        # Stopped at an over-long complete line, or the partial line is already too long
+        if nl != -1 or used - start > MAX_LINE_LENGTH:
+            self._reject_line(sel, conn, client)
+            return
 
-            elif cmd == "FOLLOW":
-                return self._cmd_follow(arg)
+        # Move any partial line to the front of the buffer
+        if start:
+            rxbuf[:used - start] = rxbuf[start:used]
+            used -= start
+        client.used = used
 
-            elif cmd == "STATUS":
-                return self._cmd_status()
+        # Replies to everything in this read go out together
+        if client.out:
+            self._flush(sel, conn, client)
 
-            elif cmd == "LEVELS":
-                return self._cmd_levels()
+    def _reject_line(self, sel: selectors.BaseSelector, conn: socket.socket, client: "_Connection"):
+        """Answer an over-long line with an error and drop the client."""
+        client.out += _ERR_LINE_TOO_LONG
+        try:
+            conn.send(client.out)
+        except OSError:
+            pass
+        logger.debug("CommandServer line too long from %s", client.addr)
+        self._close(sel, conn, client)
+
+    def _flush(self, sel: selectors.BaseSelector, conn: socket.socket, client: "_Connection"):
+        """Send queued output, waiting for EVENT_WRITE while the socket will not take all of it."""
+        try:
+            sent = conn.send(client.out)
+        except (BlockingIOError, InterruptedError):
+            sent = 0
+        del client.out[:sent]
+
+        if len(client.out) > MAX_PENDING_OUTPUT:
+            events = selectors.EVENT_WRITE  # Client isn't reading its replies - stop taking commands
+        elif client.out:
+            events = selectors.EVENT_READ | selectors.EVENT_WRITE
+        else:
+            events = selectors.EVENT_READ
+        if sel.get_key(conn).events != events:
+            sel.modify(conn, events, data=client)
 
-            elif cmd == "PTT":
-                if arg == "TEST":
-                    return self._cmd_ptt_test()
-                return "ERROR Unknown PTT command. Use: PTT TEST"
+    def _reap_idle(self, sel: selectors.BaseSelector, now: float) -> Optional[float]:
+        """
+        Close clients that have not sent anything for CLIENT_IDLE_TIMEOUT seconds.
 
-            elif cmd == "TX":
-                return self._cmd_tx(arg)
+        Returns the seconds until the next client would go idle, or None when
+        there are no clients, for use as the select() timeout.
+        """
+        next_deadline = None
+        for key in list(sel.get_map().values()):
+            client = key.data
+            if client is None:
+                continue
+            deadline = client.last_active + CLIENT_IDLE_TIMEOUT
+            if now >= deadline:
+                logger.debug("CommandServer closing idle connection from %s", client.addr)
+                self._close(sel, key.fileobj, client)
+            elif next_deadline is None or deadline < next_deadline:
+                next_deadline = deadline
+        return None if next_deadline is None else next_deadline - now
+
+    def _close(self, sel: selectors.BaseSelector, conn: socket.socket, client: "_Connection"):
+        """Unregister and close a client connection."""
+        try:
+            sel.unregister(conn)
+        except (KeyError, ValueError):
+            return  # Already closed
+        try:
+            conn.close()
+        except:
+            pass
+        _RXPOOL.put(client.rxbuf)
+        self._release_slot()
+        logger.debug("CommandServer connection closed from %s", client.addr)
+
+    def _release_slot(self):
+        """Give back a client slot taken in _accept."""
+        with self._clients_lock:
+            self._clients -= 1
+
+    def _process_command(self, command: bytes) -> str | bytes | None:
+        """
+        Process a single command line and return response (str, or bytes ready to send).
 
-            elif cmd == "CLEAR":
-                return self._cmd_clear()
+        Blank lines are ignored and return None.
+        """
+        line = command.translate(_UPPER_LUT).strip(b' \t\r')
+        if not line:
+            return None
 
-            elif cmd == "SAVE":
-                return self._cmd_save()
+        # Split at the first space or tab; find() misses (-1) wrap round to len(line)
+        end = len(line) + 1
+        sp = min(line.find(b' ') % end, line.find(b'\t') % end)
+        cmd = line[:sp]
+        arg = line[sp + 1:].lstrip(b' \t')
 
-            else:
-                return f"ERROR Unknown command: {cmd}"
+        handler = self._dispatch.get(cmd)
+        if handler is None:
+            return f"ERROR Unknown command: {cmd.decode('utf-8', 'ignore')}"
 
+        try:
+            return handler(arg)
         except Exception as e:
-            logger.error(f"CommandServer error processing '{command}': {e}")
+            logger.error(f"CommandServer error processing '{command.decode('utf-8', 'ignore')}': {e}")
             return f"ERROR {str(e)}"
 
-    def _cmd_mode(self, arg: str) -> str:
+    def _cmd_ping(self, arg: bytes) -> str | bytes:
+        """Handle PING command."""
+        return _OK_PONG
+
+    def _cmd_mode(self, arg: bytes) -> str | bytes:
         """Handle MODE command."""
         if not arg:
             # Query current mode
-            return f"OK MODE {self.modem_tx.modem.modem_name}"
+            return _MODE_FMT(self.modem_tx.modem.modem_name)
 
-        mode = arg.upper()
+        mode = arg.decode('utf-8', 'ignore')
         if mode not in self.valid_modes:
-            return f"ERROR Invalid mode. Valid: {', '.join(self.valid_modes)}"
+            return self._valid_modes_msg
 
         self.modem_tx.set_mode(mode)
         self.options.mode = mode
         logger.info(f"Mode changed to {mode}")
-        return f"OK MODE {mode}"
+        return _MODE_FMT(mode)
 
-    def _cmd_volume(self, arg: str) -> str:
+    def _cmd_volume(self, arg: bytes) -> str | bytes:
         """Handle VOLUME command."""
         if not arg:
             # Query current volume
-            return f"OK VOLUME {self.options.output_volume}"
+            return _VOLUME_FMT(self.options.output_volume)
 
         try:
             volume = float(arg)
             self.output_device.db = volume
             self.options.output_volume = volume
             logger.info(f"Volume changed to {volume} dB")
-            return f"OK VOLUME {volume}"
+            return _VOLUME_FMT(volume)
         except ValueError:
-            return "ERROR Invalid volume (must be number in dB)"
+            return _ERR_VOLUME
 
-    def _cmd_follow(self, arg: str) -> str:
+    def _cmd_follow(self, arg: bytes) -> str | bytes:
         """Handle FOLLOW command."""
         if not arg:
             # Query current follow state
-            state = "ON" if self.options.follow else "OFF"
-            return f"OK FOLLOW {state}"
+            return _OK_FOLLOW_ON if self.options.follow else _OK_FOLLOW_OFF
 
-        arg = arg.upper()
-        if arg == "ON":
+        if arg == b"ON":
             self.options.follow = True
             logger.info("Follow mode enabled")
-            return "OK FOLLOW ON"
-        elif arg == "OFF":
+            return _OK_FOLLOW_ON
+        elif arg == b"OFF":
             self.options.follow = False
             logger.info("Follow mode disabled")
-            return "OK FOLLOW OFF"
+            return _OK_FOLLOW_OFF
         else:
-            return "ERROR Invalid follow state. Use: ON or OFF"
+            return _ERR_FOLLOW
 
-    def _cmd_status(self) -> str:
+    def _cmd_status(self, arg: bytes) -> str | bytes:
         """Handle STATUS command."""
-        mode = self.modem_tx.modem.modem_name
-        volume = self.options.output_volume
-        follow = "ON" if self.options.follow else "OFF"
-        ptt = "ON" if getattr(self.output_device, 'ptt', False) else "OFF"
-        channel = "BUSY" if getattr(self.output_device, 'inhibit', False) else "CLEAR"
-
-        return f"OK STATUS MODE={mode} VOLUME={volume} FOLLOW={follow} PTT={ptt} CHANNEL={channel}"
-
-    def _cmd_levels(self) -> str:
+        return _STATUS_FMT(
+            self.modem_tx.modem.modem_name,
+            self.options.output_volume,
+            "ON" if self.options.follow else "OFF",
+            "ON" if self.output_device.ptt else "OFF",
+            "BUSY" if self.output_device.inhibit else "CLEAR",
+        )
+
+    def _cmd_levels(self, arg: bytes) -> str | bytes:
         """Handle LEVELS command."""
         try:
             rx_level = self.input_device.input_level
@@ -256,46 +551,51 @@ class CommandServer:
         except Exception as e:
             return f"ERROR Could not read levels: {e}"
 
-    def _cmd_ptt_test(self) -> str:
+    def _cmd_ptt(self, arg: bytes) -> str | bytes:
+        """Handle PTT commands."""
+        if arg == b"TEST":
+            return self._cmd_ptt_test()
+        return _ERR_PTT
+
+    def _cmd_ptt_test(self) -> str | bytes:
         """Handle PTT TEST command."""
         try:
-            import pydub.generators
-
-            sin_wave = pydub.generators.Sine(
-                440,
-                sample_rate=self.modem_tx.modem.sample_rate,
-                bit_depth=16,
-            ).to_audio_segment(2000, volume=-6)
-            sin_wave.set_channels(1)
-
-            self.output_device.write_raw(sin_wave.raw_data)
+            sample_rate = self.modem_tx.modem.sample_rate
+            raw = self._ptt_cache.get(sample_rate)
+            if raw is None:
+                sin_wave = pydub.generators.Sine(
+                    440,
+                    sample_rate=sample_rate,
+                    bit_depth=16,
+                ).to_audio_segment(2000, volume=-6)
+                sin_wave.set_channels(1)
+                raw = self._ptt_cache[sample_rate] = sin_wave.raw_data
+
+            self.output_device.write_raw(raw)
             logger.info("PTT test triggered")
-            return "OK PTT TEST started"
+            return _OK_PTT_TEST
         except Exception as e:
             return f"ERROR PTT test failed: {e}"
 
-    def _cmd_clear(self) -> str:
+    def _cmd_clear(self, arg: bytes) -> str | bytes:
         """Handle CLEAR command."""
         try:
             self.output_device.clear()
             with self.output_device.send_queue_lock:
-                self.output_device.send_queue = []
+                self.output_device.send_queue.clear()
             logger.info("TX buffer cleared")
-            return "OK CLEAR"
+            return _OK_CLEAR
         except Exception as e:
             return f"ERROR Clear failed: {e}"
 
-    def _cmd_save(self) -> str:
+    def _cmd_save(self, arg: bytes) -> str | bytes:
         """Handle SAVE command."""
         try:
-            from pathlib import Path
-            import configargparse
-
-            path = str(Path.home() / ".freedvtnc2.conf")
+            path = self._save_path
             with open(path, "w") as f:
                 f.write(
-                    configargparse.DefaultConfigFileParser().serialize({
-                        key.replace("_", "-"): str(value) if value is not None else ""
+                    _SAVE_PARSER.serialize({
+                        _config_key(key): str(value) if value is not None else ""
                         for key, value in vars(self.options).items()
                         if key != "c"
                     })
@@ -305,7 +605,7 @@ class CommandServer:
         except Exception as e:
             return f"ERROR Save failed: {e}"
 
-    def _cmd_tx(self, arg: str) -> str:
+    def _cmd_tx(self, arg: bytes) -> str | bytes:
         """
         Handle TX gate commands.
 
@@ -315,33 +615,33 @@ class CommandServer:
         TX STATUS  - Get current TX gate status
         """
         parts = arg.split()
-        subcmd = parts[0] if parts else ""
+        subcmd = parts[0] if parts else b""
 
-        if subcmd == "ENABLE":
+        if subcmd == b"ENABLE":
             self.output_device.tx_enable()
-            return "OK TX ENABLED"
+            return _OK_TX_ENABLED
 
-        elif subcmd == "DISABLE":
+        elif subcmd == b"DISABLE":
             self.output_device.tx_disable()
-            return "OK TX DISABLED"
+            return _OK_TX_DISABLED
 
-        elif subcmd == "WINDOW":
+        elif subcmd == b"WINDOW":
             if len(parts) < 2:
-                return "ERROR TX WINDOW requires seconds argument"
+                return _ERR_TX_WINDOW_ARG
             try:
                 seconds = int(parts[1])
                 if seconds < 1 or seconds > 600:
-                    return "ERROR TX WINDOW seconds must be 1-600"
+                    return _ERR_TX_WINDOW_RANGE
                 self.output_device.tx_window(seconds)
                 return f"OK TX WINDOW {seconds}"
             except ValueError:
-                return "ERROR TX WINDOW seconds must be integer"
+                return _ERR_TX_WINDOW_INT
 
-        elif subcmd == "STATUS":
+        elif subcmd == b"STATUS":
             state, remaining = self.output_device.tx_status()
             if remaining is not None:
                 return f"OK TX {state}:{remaining}"
             return f"OK TX {state}"
 
         else:
-            return "ERROR Unknown TX command. Use: TX ENABLE|DISABLE|WINDOW <sec>|STATUS"
+            return _ERR_TX
@@ -111,7 +111,7 @@ class FreeDVShellCommands():
         "Clears TX queues"
         self.output_device.clear()
         with self.output_device.send_queue_lock:
-            self.output_device.send_queue = []
+            self.output_device.send_queue.clear()
         return "TX buffer cleared"
 
     def do_list_audio_devices(self, arg):
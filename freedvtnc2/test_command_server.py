@@ -0,0 +1,116 @@
+import logging
+logging.basicConfig(level=logging.DEBUG)
+
+import argparse
+import errno
+import socket
+import time
+import unittest
+from unittest.mock import Mock, patch
+from . import command_server
+
+
+class TestCommandServer(unittest.TestCase):
+    def setUp(self):
+        modem_tx = Mock()
+        modem_tx.modem.modem_name = "DATAC1"
+        options = argparse.Namespace(
+            mode="DATAC1", output_volume=0.0, follow=False, cmd_workers=1, cmd_max_clients=2
+        )
+        self.server = command_server.CommandServer(
+            modem_tx, Mock(ptt=False, inhibit=False), Mock(), options, port=0, address="127.0.0.1"
+        )
+        self.server.start()
+        deadline = time.monotonic() + 2
+        while not self.server.server_sockets and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.port = self.server.server_sockets[0].getsockname()[1]
+        self.clients = []
+
+    def tearDown(self):
+        for conn in self.clients:
+            conn.close()
+        self.server.stop()
+        for thread in self.server._threads:
+            thread.join(2)
+
+    def connect(self) -> socket.socket:
+        conn = socket.create_connection(("127.0.0.1", self.port), timeout=2)
+        self.clients.append(conn)
+        return conn
+
+    def read_lines(self, conn: socket.socket, count: int) -> list[bytes]:
+        data = b""
+        while data.count(b"\n") < count:
+            chunk = conn.recv(4096)
+            if not chunk:
+                break
+            data += chunk
+        return data.splitlines()
+
+    def read_all(self, conn: socket.socket) -> bytes:
+        data = b""
+        try:
+            while chunk := conn.recv(4096):
+                data += chunk
+        except ConnectionResetError:
+            pass
+        return data
+
+    def test_command_split_across_sends(self):
+        conn = self.connect()
+        conn.sendall(b"PI")
+        time.sleep(0.05)
+        conn.sendall(b"NG\n")
+        self.assertEqual(self.read_lines(conn, 1), [b"OK PONG"])
+
+    def test_several_commands_in_one_send(self):
+        conn = self.connect()
+        conn.sendall(b"PING\nfollow\nMODE\n")
+        self.assertEqual(self.read_lines(conn, 3), [b"OK PONG", b"OK FOLLOW OFF", b"OK MODE DATAC1"])
+
+    def test_blank_line_gets_no_reply(self):
+        conn = self.connect()
+        conn.sendall(b"\n  \r\nPING\n")
+        self.assertEqual(self.read_lines(conn, 1), [b"OK PONG"])
+
+    def test_line_too_long(self):
+        conn = self.connect()
+        conn.sendall(b"A" * (command_server.MAX_LINE_LENGTH + 1) + b"\n")
+        self.assertEqual(self.read_all(conn), b"ERROR Line too long\n")
+
+    def test_max_clients(self):
+        for _ in range(2):
+            conn = self.connect()
+            conn.sendall(b"PING\n")
+            self.assertEqual(self.read_lines(conn, 1), [b"OK PONG"])
+        self.assertEqual(self.read_all(self.connect()), b"ERROR Too many connections\n")
+
+    def test_stop_joins_promptly(self):
+        start = time.monotonic()
+        self.server.stop()
+        for thread in self.server._threads:
+            thread.join(1)
+            self.assertFalse(thread.is_alive())
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_accept_setup_failure_keeps_server_running(self):
+        setsockopt = socket.socket.setsockopt
+
+        def fail_nodelay(sock, level, option, value):
+            if option == socket.TCP_NODELAY:
+                raise OSError(errno.EINVAL, "Invalid argument")
+            return setsockopt(sock, level, option, value)
+
+        with patch.object(socket.socket, "setsockopt", fail_nodelay):
+            self.assertEqual(self.read_all(self.connect()), b"")
+
+        # The failed client must not hold one of the two slots
+        for _ in range(2):
+            conn = self.connect()
+            conn.sendall(b"PING\n")
+            self.assertEqual(self.read_lines(conn, 1), [b"OK PONG"])
+
+
+if __name__ == '__main__':
+    unittest.main()